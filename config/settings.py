@@ -4,7 +4,53 @@ from dotenv import load_dotenv
 load_dotenv()
 
 class Settings:
-    GROQ_API_KEY = os.getenv("GROQ_API_KEY")  
+    GROQ_API_KEY = os.getenv("GROQ_API_KEY")
     SEARCH_API_KEY = os.getenv("SEARCH_API_KEY", None)
-    DEFAULT_MODEL = "mixtral-8x7b-32768" 
-    SEARCH_RESULTS_LIMIT = 5
\ No newline at end of file
+    DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", "openai/gpt-oss-20b")
+    SEARCH_RESULTS_LIMIT = 5
+
+    # Per-stage model routing: cheap stages use a small fast model,
+    # verification and synthesis use the larger one.
+    STAGE_MODELS = {
+        "initial": DEFAULT_MODEL,
+        "extract": "llama-3.1-8b-instant",
+        "classify": "llama-3.1-8b-instant",
+        "verify": "openai/gpt-oss-120b",
+        "synthesize": "openai/gpt-oss-120b",
+    }
+
+    # Alternate model tried when a model is rejected (HTTP 400/404)
+    FALLBACK_MODELS = {
+        "openai/gpt-oss-120b": DEFAULT_MODEL,
+        "llama-3.1-8b-instant": DEFAULT_MODEL,
+        DEFAULT_MODEL: "llama-3.3-70b-versatile",
+    }
+
+    # USD per million tokens as (input, output), used for the routing report
+    MODEL_COSTS = {
+        "openai/gpt-oss-20b": (0.10, 0.50),
+        "openai/gpt-oss-120b": (0.15, 0.75),
+        "llama-3.1-8b-instant": (0.05, 0.08),
+        "llama-3.3-70b-versatile": (0.59, 0.79),
+    }
+
+    # Verification prompt evidence: estimated-token budget and per-snippet cap
+    EVIDENCE_TOKEN_BUDGET = 400
+    EVIDENCE_SNIPPET_CHARS = 300
+
+    # Per-assumption verdict reuse across claims: freshness window (seconds)
+    # and optional JSON file that processes on the same host merge into
+    ASSUMPTION_CACHE_TTL = int(os.getenv("ASSUMPTION_CACHE_TTL", 24 * 3600))
+    ASSUMPTION_CACHE_FILE = os.getenv("ASSUMPTION_CACHE_FILE")
+    ASSUMPTION_CACHE_MAX_ENTRIES = int(os.getenv("ASSUMPTION_CACHE_MAX_ENTRIES", 10000))
+
+    # Streamlit dashboard: concurrent pipelines per server, seconds a claim's
+    # result is reused across sessions, and progress refresh interval
+    STREAMLIT_WORKERS = int(os.getenv("STREAMLIT_WORKERS", 4))
+    RESULT_CACHE_TTL = int(os.getenv("RESULT_CACHE_TTL", 3600))
+    PROGRESS_POLL_INTERVAL = 0.5
+
+    # LLM backend: "groq", or "local" for the offline deterministic stand-in
+    # with LOCAL_LLM_LATENCY seconds of simulated latency per call
+    LLM_PROVIDER = os.getenv("LLM_PROVIDER", "groq")
+    LOCAL_LLM_LATENCY = float(os.getenv("LOCAL_LLM_LATENCY", 0.0))
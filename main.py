@@ -5,8 +5,13 @@ def main():
     claim = input("Enter claim: ")
     
     result = FactChecker().fact_check(claim)
-    print(f"\n🔎 Verdict: {result['verdict']}")
-    print(f"\n📝 Report:\n{result['report']}")
+    if result["status"] == "error":
+        print(f"\n❌ Error: {result['error']}")
+        return
+
+    final = result["final_answer"]
+    print(f"\n🔎 Verdict: {final['verdict']} ({final['confidence']} confidence)")
+    print(f"\n📝 Report:\n{final['summary']}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,232 @@
+import os
+import re
+import threading
+import time
+import unicodedata
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from .utils import clean_text, load_from_cache, log_error, save_to_cache
+
+try:
+    import fcntl
+except ImportError:  # Windows: writes are still atomic, just not serialized
+    fcntl = None
+
+# One list marker: a bullet, a number ("1." / "1)" / "(1)"), a lowercase
+# letter ("a)" / "(a)"), or a bullet followed by one of those. Uppercase
+# "A." is not accepted because it is indistinguishable from initials.
+_ENUM = r"(?:\d+[.)]|\(\d+\)|\(?[a-z]\))"
+_PREFIX = re.compile(rf"^(?:[-*•>]\s+(?:{_ENUM}\s+)?|{_ENUM}\s+)")
+_HEADER = re.compile(r"^(?:#+\s*|[-=_*]{3,}$)")
+# Section titles the extraction prompt tends to echo back, with or without a colon
+_TITLE = re.compile(r"^(?:(?:verifiable|factual|key)\s+)*claims?\s*:?$", re.IGNORECASE)
+
+
+def normalize_assumption(line: str) -> Optional[str]:
+    """
+    Strip list markup from an extracted line and drop lines that are not claims.
+
+    Args:
+        line: Raw line from the assumption extraction output
+
+    Returns:
+        str or None: Cleaned claim text, or None for headers/blank/markup lines
+    """
+    text = clean_text(line)
+    if not text or _HEADER.match(text):
+        return None
+    text = text.replace("**", "").replace("__", "").strip()
+    text = _PREFIX.sub("", text, count=1).strip(" \"'`")
+    if not text or _TITLE.match(text) or text.endswith(":") or len(text.split()) < 2:
+        return None
+    return text
+
+
+def canonical_key(assumption: str) -> str:
+    """Case-, punctuation- and number-format-insensitive key for an assumption."""
+    text = unicodedata.normalize("NFC", assumption).casefold()
+    text = re.sub(r"(?<=\d),(?=\d{3}\b)", "", text)
+    text = re.sub(r"[^\w.%]+", " ", text)
+    text = re.sub(r"\.(?!\d)", " ", text)
+    return " ".join(text.split())
+
+
+def _namespaced(namespace: str, key: str) -> str:
+    return f"{namespace}|{key}" if namespace else key
+
+
+def _is_usable_key(key: str) -> bool:
+    """Keys without letters are too ambiguous to share a verdict under."""
+    return any(ch.isalpha() for ch in key)
+
+
+class AssumptionStore:
+    """
+    Thread-safe cache of per-assumption verdicts shared across claims.
+
+    With `cache_file` set, every `put` merges this process's entries with the
+    file under an exclusive lock (newest `verified_at` wins, expired entries
+    are pruned), and a `get` miss reloads the file if another process changed it.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 86400,
+        cache_file: Optional[str] = None,
+        max_entries: int = 10000
+    ):
+        """
+        Args:
+            ttl_seconds: How long a cached verdict stays fresh
+            cache_file: Optional JSON file shared by processes on the same host
+            max_entries: Size cap; the oldest verdicts are evicted beyond it
+        """
+        self.ttl_seconds = ttl_seconds
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._file_mtime = None
+        if cache_file:
+            self._reload()
+
+    def get(self, assumption: str, namespace: str = "") -> Optional[Dict[str, Any]]:
+        """Return a fresh cached result for an assumption, or None."""
+        key = canonical_key(assumption)
+        if not _is_usable_key(key):
+            with self._lock:
+                self.misses += 1
+            return None
+        key = _namespaced(namespace, key)
+        entry = self._lookup(key)
+        if entry is None and self.cache_file and self._file_changed():
+            self._reload()
+            entry = self._lookup(key)
+        with self._lock:
+            if entry:
+                self.hits += 1
+                return dict(entry["result"])
+            self.misses += 1
+            return None
+
+    def put(self, assumption: str, result: Dict[str, Any], namespace: str = "") -> None:
+        """
+        Cache a verification result; errors are not cached.
+
+        Args:
+            assumption: Assumption text (canonicalized for the key)
+            result: Verification result to reuse
+            namespace: Keeps verdicts from different backends apart, e.g. the
+                LLM provider name, so stand-in verdicts never reach production
+        """
+        key = canonical_key(assumption)
+        if result.get("verdict") == "Error" or not _is_usable_key(key):
+            return
+        key = _namespaced(namespace, key)
+        with self._lock:
+            self._entries[key] = {
+                "assumption": assumption,
+                "verified_at": time.time(),
+                "result": dict(result)
+            }
+            self._prune()
+        if self.cache_file:
+            self._sync()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and not self._is_fresh(entry):
+                del self._entries[key]
+                return None
+            return entry
+
+    def _is_fresh(self, entry: Dict[str, Any], now: Optional[float] = None) -> bool:
+        return (now or time.time()) - entry["verified_at"] <= self.ttl_seconds
+
+    def _merge(self, disk: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Merge file entries into memory (newest wins, expired dropped); caller holds _lock."""
+        for key, entry in disk.items():
+            current = self._entries.get(key)
+            if current is None or entry["verified_at"] > current["verified_at"]:
+                self._entries[key] = entry
+        self._prune()
+        return dict(self._entries)
+
+    def _prune(self) -> None:
+        """Drop expired entries, then the oldest beyond max_entries; caller holds _lock."""
+        now = time.time()
+        entries = {k: v for k, v in self._entries.items() if self._is_fresh(v, now)}
+        if len(entries) > self.max_entries:
+            newest = sorted(entries.items(), key=lambda item: item[1]["verified_at"], reverse=True)
+            entries = dict(newest[:self.max_entries])
+        self._entries = entries
+
+    def _reload(self) -> None:
+        # File problems degrade to an in-memory cache rather than failing callers
+        try:
+            with self._file_lock():
+                self._file_mtime = self._mtime()
+                disk = load_from_cache(self.cache_file) or {}
+        except Exception as e:
+            log_error(f"Assumption cache load failed: {str(e)}")
+            return
+        with self._lock:
+            self._merge(disk)
+
+    def _sync(self) -> None:
+        """Read-merge-write the shared file so other processes' entries survive."""
+        try:
+            with self._file_lock():
+                disk = load_from_cache(self.cache_file) or {}
+                with self._lock:
+                    merged = self._merge(disk)
+                save_to_cache(merged, self.cache_file)
+                self._file_mtime = self._mtime()
+        except Exception as e:
+            log_error(f"Assumption cache sync failed: {str(e)}")
+
+    def _mtime(self) -> Optional[float]:
+        try:
+            return os.path.getmtime(self.cache_file)
+        except OSError:
+            return None
+
+    def _file_changed(self) -> bool:
+        return self._mtime() != self._file_mtime
+
+    @contextmanager
+    def _file_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(f"{self.cache_file}.lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def unique_assumptions(lines: List[str]) -> List[str]:
+    """Normalize extracted lines, drop non-claims and collapse duplicates (order kept)."""
+    seen, result = set(), []
+    for line in lines:
+        assumption = normalize_assumption(line)
+        if not assumption:
+            continue
+        key = canonical_key(assumption)
+        if not _is_usable_key(key):
+            result.append(assumption)
+        elif key not in seen:
+            seen.add(key)
+            result.append(assumption)
+    return result
@@ -0,0 +1,133 @@
+import re
+from typing import Any, Dict, List, Optional
+
+STOPWORDS = {
+    "a", "an", "the", "is", "are", "was", "were", "be", "of", "in", "on", "at",
+    "to", "for", "from", "by", "with", "and", "or", "that", "this", "it", "as",
+    "its", "than", "approximately", "about"
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token) for prompt budgeting."""
+    return max(1, len(text) // 4) if text else 0
+
+
+def _words(text: str) -> List[str]:
+    return re.findall(r"[^\W_]+", (text or "").casefold())
+
+
+def _terms(text: str) -> set:
+    return {w for w in _words(text) if w not in STOPWORDS}
+
+
+def _snippet_key(text: str) -> str:
+    return " ".join(_words(text))
+
+
+class EvidencePacker:
+    """Dedupes, ranks and renders search evidence into a compact, budgeted prompt block."""
+
+    def __init__(
+        self,
+        token_budget: int = 400,
+        max_snippet_chars: int = 300,
+        domain_scores: Optional[Dict[str, float]] = None
+    ):
+        """
+        Args:
+            token_budget: Maximum estimated tokens for the rendered evidence block
+            max_snippet_chars: Snippets longer than this are cut at a word boundary
+            domain_scores: TLD credibility scores used as a ranking tie-breaker
+        """
+        self.token_budget = token_budget
+        self.max_snippet_chars = max_snippet_chars
+        self.domain_scores = domain_scores or {}
+
+    def pack(self, query: str, sources: List[Dict]) -> Dict[str, Any]:
+        """
+        Build the evidence block for one verification prompt.
+
+        Args:
+            query: Assumption being verified (used for relevance ranking)
+            sources: Search results with title/url/snippet/domain keys
+
+        Returns:
+            {
+                "text": str,            # rendered citation block
+                "sources": List[Dict],  # sources kept, in citation order
+                "tokens": int,          # estimated tokens of "text"
+                "dropped": int          # duplicates and over-budget sources
+            }
+        """
+        unique = self._dedupe(sources)
+        query_terms = _terms(query)
+        ranked = sorted(unique, key=lambda s: self._relevance(query_terms, s), reverse=True)
+
+        lines, kept = [], []
+        for source in ranked:
+            # Budget the joined block itself so separators are counted
+            line = self._render(len(kept) + 1, source)
+            if estimate_tokens("\n".join(lines + [line])) > self.token_budget:
+                if kept:
+                    continue
+                # The top source alone is over budget: shorten it to fit
+                line = self._render(len(kept) + 1, source, max_chars=self.token_budget * 4)
+                if not line:
+                    continue
+            lines.append(line)
+            kept.append(source)
+
+        text = "\n".join(lines) if lines else "No evidence found."
+        return {
+            "text": text,
+            "sources": kept,
+            "tokens": estimate_tokens(text),
+            "dropped": len(sources) - len(kept)
+        }
+
+    def _dedupe(self, sources: List[Dict]) -> List[Dict]:
+        """Drop repeated URLs and snippets that repeat (or are contained in) another."""
+        seen_urls, keys, unique = set(), [], []
+        for source in sources:
+            url = source.get("url")
+            key = _snippet_key(source.get("snippet"))
+            if not key or (url and url in seen_urls):
+                continue
+            if any(key in other for other in keys):
+                continue
+            # A longer snippet supersedes shorter ones it contains
+            for i in reversed(range(len(keys))):
+                if keys[i] in key:
+                    del keys[i]
+                    del unique[i]
+            keys.append(key)
+            unique.append(source)
+            if url:
+                seen_urls.add(url)
+        return unique
+
+    def _relevance(self, query_terms: set, source: Dict) -> float:
+        overlap = 0.0
+        if query_terms:
+            text_terms = _terms(f"{source.get('title') or ''} {source.get('snippet') or ''}")
+            overlap = len(query_terms & text_terms) / len(query_terms)
+        domain = (source.get("domain") or "").lower()
+        credibility = self.domain_scores.get(
+            "." + domain.split(".")[-1], self.domain_scores.get("other", 0.5)
+        )
+        return overlap + 0.1 * credibility
+
+    def _render(self, index: int, source: Dict, max_chars: Optional[int] = None) -> str:
+        """Render one citation line, at most `max_chars` long ("" if it cannot fit)."""
+        domain = source.get("domain") or "unknown"
+        snippet_chars = self.max_snippet_chars
+        if max_chars is not None:
+            overhead = len(f"[{index}]  ({domain})") + 1
+            snippet_chars = min(snippet_chars, max_chars - overhead)
+            if snippet_chars <= 0:
+                return ""
+        snippet = " ".join((source.get("snippet") or "").split())
+        if len(snippet) > snippet_chars:
+            snippet = snippet[:snippet_chars].rsplit(" ", 1)[0] + "…"
+        return f"[{index}] {snippet} ({domain})"
@@ -1,8 +1,7 @@
 import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from groq import Groq
+from typing import Callable, Dict, List, Any, Optional
 
 # Add src directory to path for module imports
 sys.path.append(str(Path(__file__).parent))
@@ -14,32 +13,72 @@ from src.prompt_chains import (
     FINAL_SYNTHESIS_TEMPLATE
 )
 from src.search_tools import WebSearchTool
+from src.model_router import ModelRouter
+from src.evidence_packer import EvidencePacker, estimate_tokens
+from src.assumption_store import AssumptionStore, unique_assumptions
+from src.llm_providers import LLMProvider, create_provider
+from config.settings import Settings
 from src.utils import log_error, validate_claim
 
 class FactChecker:
-    """Main fact-checking class using Groq API."""
+    """Main fact-checking class; LLM calls go through a pluggable LLMProvider."""
 
-    def __init__(self, groq_api_key: str, search_api_key: Optional[str] = None):
+    def __init__(
+        self,
+        groq_api_key: Optional[str] = None,
+        search_api_key: Optional[str] = None,
+        assumption_store: Optional[AssumptionStore] = None,
+        provider: Optional[LLMProvider] = None,
+        search_tool: Optional[WebSearchTool] = None
+    ):
         """
-        Initialize fact checker with Groq API.
+        Initialize fact checker.
         
         Args:
-            groq_api_key: Groq API key
+            groq_api_key: Groq API key (used when Settings.LLM_PROVIDER is "groq")
             search_api_key: Optional search API key (SerpAPI, etc.)
+            assumption_store: Verdict cache to share between checkers; one is
+                created from Settings if omitted
+            provider: LLM backend; built from Settings.LLM_PROVIDER if omitted
+            search_tool: Object with a `search(query)` method; defaults to WebSearchTool
         """
-        self.client = Groq(api_key=groq_api_key)
-        self.search_tool = WebSearchTool(api_key=search_api_key)
-        self.model = "openai/gpt-oss-20b"  
+        self.provider = provider or self._default_provider(groq_api_key)
+        self.search_tool = search_tool or WebSearchTool(api_key=search_api_key)
+        self.router = ModelRouter(
+            stage_models=Settings.STAGE_MODELS,
+            default_model=Settings.DEFAULT_MODEL,
+            fallback_models=Settings.FALLBACK_MODELS,
+            model_costs=Settings.MODEL_COSTS
+        )
 
         self.domain_scores = {
             '.gov': 0.9, '.edu': 0.85, '.org': 0.8,
             '.com': 0.7, '.net': 0.6, 'other': 0.5
         }
+        self.evidence_packer = EvidencePacker(
+            token_budget=Settings.EVIDENCE_TOKEN_BUDGET,
+            max_snippet_chars=Settings.EVIDENCE_SNIPPET_CHARS,
+            domain_scores=self.domain_scores
+        )
+        self.assumption_store = assumption_store or AssumptionStore(
+            ttl_seconds=Settings.ASSUMPTION_CACHE_TTL,
+            cache_file=Settings.ASSUMPTION_CACHE_FILE,
+            max_entries=Settings.ASSUMPTION_CACHE_MAX_ENTRIES
+        )
 
-    def fact_check(self, claim: str) -> Dict[str, Any]:
+    def fact_check(
+        self,
+        claim: str,
+        progress_callback: Optional[Callable[[str, float], None]] = None
+    ) -> Dict[str, Any]:
         """
         Full fact-checking pipeline.
         
+        Args:
+            claim: Statement to check
+            progress_callback: Optional `callback(stage, fraction)` called as
+                each stage starts and once more with ("Done", 1.0)
+
         Returns:
             {
                 "claim": str,
@@ -55,16 +94,29 @@ class FactChecker:
             if not validate_claim(claim):
                 return {"error": "Invalid claim", "status": "error"}
 
+            progress = progress_callback or (lambda stage, fraction: None)
+
+            progress("Generating initial assessment", 0.0)
             initial = self._get_initial_response(claim)
             
+            progress("Extracting assumptions", 0.15)
             assumptions = self._extract_assumptions(initial)
             
-            verification = self._verify_assumptions(assumptions)
+            progress("Verifying assumptions", 0.3)
+            verification = self._verify_assumptions(
+                assumptions,
+                on_verified=lambda done, total: progress(
+                    f"Verified {done}/{total} assumptions", 0.3 + 0.5 * done / total
+                )
+            )
             
+            progress("Synthesizing final report", 0.8)
             final = self._synthesize_final(claim, initial, verification)
             
+            progress("Classifying claim", 0.95)
             claim_type = self._classify_claim(claim)
 
+            progress("Done", 1.0)
             return {
                 "claim": claim,
                 "claim_type": claim_type,
@@ -79,72 +131,107 @@ class FactChecker:
             log_error(f"Fact-check failed: {str(e)}")
             return {"error": str(e), "status": "error"}
 
-    def _query_groq(self, prompt: str) -> str:
-        """Execute query against Groq API."""
+    @staticmethod
+    def _default_provider(groq_api_key: Optional[str]) -> LLMProvider:
+        if Settings.LLM_PROVIDER == "local":
+            return create_provider("local", latency=Settings.LOCAL_LLM_LATENCY)
+        return create_provider(Settings.LLM_PROVIDER, api_key=groq_api_key)
+
+    def routing_report(self) -> List[Dict[str, Any]]:
+        """Cost/latency report per (stage, model) route since construction."""
+        return self.router.report()
+
+    def _query_llm(self, prompt: str, stage: str = "default") -> str:
+        """Execute query against the LLM provider using the model routed for `stage`."""
+        def call(model: str):
+            response = self.provider.complete(prompt, model=model, temperature=0.3)
+            return response.text, response
+
         try:
-            response = self.client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model=self.model,
-                temperature=0.3
-            )
-            return response.choices[0].message.content
+            return self.router.run(stage, call)
         except Exception as e:
-            log_error(f"Groq query failed: {str(e)}")
+            log_error(f"LLM query failed: {str(e)}")
             raise
 
     def _get_initial_response(self, claim: str) -> str:
         """Generate preliminary assessment."""
         prompt = INITIAL_RESPONSE_TEMPLATE.format(claim=claim)
-        return self._query_groq(prompt)
+        return self._query_llm(prompt, stage="initial")
 
     def _extract_assumptions(self, text: str) -> List[str]:
-        """Extract verifiable claims."""
+        """Extract verifiable claims, normalized and deduplicated."""
         prompt = ASSUMPTION_EXTRACTION_TEMPLATE.format(response=text)
-        result = self._query_groq(prompt)
-        return [line.strip() for line in result.split('\n') if line.strip()]
+        result = self._query_llm(prompt, stage="extract")
+        return unique_assumptions(result.split('\n'))
 
-    def _verify_assumptions(self, assumptions: List[str]) -> Dict[str, Dict]:
-        """Verify each assumption with evidence."""
+    def _verify_assumptions(
+        self,
+        assumptions: List[str],
+        on_verified: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Dict]:
+        """Verify each assumption with evidence, reporting (done, total) after each."""
         results = {}
         
-        for assumption in assumptions:
-            try:
-                evidence = self.search_tool.search(assumption)
-                
-                prompt = VERIFICATION_TEMPLATE.format(
-                    assumption=assumption,
-                    evidence=evidence
-                )
-                analysis = self._query_groq(prompt)
-                
-                verdict = "Uncertain"
-                if "Verdict:" in analysis:
-                    verdict = analysis.split("Verdict:")[1].split("\n")[0].strip()
-                
-                results[assumption] = {
-                    "verdict": verdict,
-                    "evidence": evidence,
-                    "credibility": self._score_credibility(evidence),
-                    "analysis": analysis
-                }
-                
-            except Exception as e:
-                log_error(f"Failed to verify '{assumption}': {str(e)}")
-                results[assumption] = {
-                    "verdict": "Error",
-                    "error": str(e)
-                }
+        for done, assumption in enumerate(assumptions, 1):
+            results[assumption] = self._verify_assumption(assumption)
+            if on_verified:
+                on_verified(done, len(assumptions))
         
         return results
 
+    def _verify_assumption(self, assumption: str) -> Dict:
+        """Verify one assumption, reusing a fresh cached verdict when available."""
+        cached = self.assumption_store.get(assumption, namespace=self.provider.name)
+        if cached:
+            # No prompt was sent for a cache hit; keep the original size separately
+            cached["original_prompt_tokens"] = cached.get("prompt_tokens", 0)
+            cached["prompt_tokens"] = 0
+            cached["cached"] = True
+            return cached
+
+        try:
+            evidence = self.search_tool.search(assumption)
+            packed = self.evidence_packer.pack(assumption, evidence)
+            
+            prompt = VERIFICATION_TEMPLATE.format(
+                assumption=assumption,
+                evidence=packed["text"]
+            )
+            analysis = self._query_llm(prompt, stage="verify")
+            
+            verdict = "Uncertain"
+            if "Verdict:" in analysis:
+                verdict = analysis.split("Verdict:")[1].split("\n")[0].strip()
+            
+            result = {
+                "verdict": verdict,
+                "evidence": packed["sources"],
+                "credibility": self._score_credibility(packed["sources"]),
+                "analysis": analysis,
+                "prompt_tokens": estimate_tokens(prompt),
+                "evidence_dropped": packed["dropped"]
+            }
+            
+        except Exception as e:
+            log_error(f"Failed to verify '{assumption}': {str(e)}")
+            return {
+                "verdict": "Error",
+                "error": str(e)
+            }
+
+        # An empty result usually means search failed; don't share that verdict
+        if packed["sources"]:
+            self.assumption_store.put(assumption, result, namespace=self.provider.name)
+        return result
+
     def _synthesize_final(self, claim: str, initial: str, verification: Dict) -> Dict:
         """Generate final report."""
         prompt = FINAL_SYNTHESIS_TEMPLATE.format(
             claim=claim,
             initial_response=initial,
-            verification_results=str(verification)
+            verification_results=self._summarize_verification(verification)
         )
-        result = self._query_groq(prompt)
+        result = self._query_llm(prompt, stage="synthesize")
         
         return {
             "verdict": self._parse_verdict(result),
@@ -152,6 +239,23 @@ class FactChecker:
             "confidence": self._estimate_confidence(result)
         }
 
+    def _summarize_verification(self, verification: Dict[str, Dict]) -> str:
+        """One line per assumption: verdict, short reasoning and cited domains."""
+        lines = []
+        for assumption, details in verification.items():
+            analysis = details.get("analysis") or details.get("error") or ""
+            reasoning = analysis.split("Reasoning:", 1)[-1]
+            reasoning = " ".join(reasoning.split())
+            if len(reasoning) > 200:
+                reasoning = reasoning[:200].rsplit(" ", 1)[0] + "…"
+            domains = ", ".join(
+                source.get("domain") for source in details.get("evidence", [])[:3]
+                if source.get("domain")
+            )
+            line = f"- {assumption} => {details.get('verdict', 'Uncertain')}: {reasoning}"
+            lines.append(f"{line} (sources: {domains})" if domains else line)
+        return "\n".join(lines) if lines else "No assumptions verified."
+
     def _classify_claim(self, claim: str) -> str:
         """Classify claim type."""
         prompt = f"""Classify this claim:
@@ -159,7 +263,7 @@ class FactChecker:
         
         Claim: {claim}
         Category:"""
-        return self._query_groq(prompt).strip()
+        return self._query_llm(prompt, stage="classify").strip()
 
     def _score_credibility(self, sources: List[Dict]) -> float:
         """Calculate average source credibility."""
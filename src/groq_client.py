@@ -1,27 +1,24 @@
 import os
-from groq import Groq
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from config.settings import Settings
+from .llm_providers import GroqProvider, LLMProvider
 
 class GroqClient:
-    """Lightweight Groq API client with error handling."""
-    
-    def __init__(self):
-        self.client = Groq(api_key=os.getenv("GROQ_API_KEY"))
-    
-    def query(self, prompt: str, model: str = "mixtral-8x7b-32768") -> Dict[str, Any]:
-        """Run a single LLM query."""
+    """Lightweight LLM client with error handling (Groq by default)."""
+
+    def __init__(self, provider: Optional[LLMProvider] = None):
+        self.provider = provider or GroqProvider(api_key=os.getenv("GROQ_API_KEY"))
+
+    def query(self, prompt: str, model: Optional[str] = None) -> Dict[str, Any]:
+        """Run a single LLM query (defaults to Settings.DEFAULT_MODEL)."""
         try:
-            response = self.client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model=model,
-                temperature=0.3
-            )
+            response = self.provider.complete(prompt, model=model or Settings.DEFAULT_MODEL)
             return {
                 "success": True,
-                "output": response.choices[0].message.content
+                "output": response.text
             }
         except Exception as e:
             return {
                 "success": False,
                 "error": str(e)
-            }
\ No newline at end of file
+            }
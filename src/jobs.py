@@ -0,0 +1,78 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from .utils import clean_text
+
+
+class FactCheckJob:
+    """A fact-check running in the background, with live stage progress."""
+
+    def __init__(self, claim: str):
+        self.claim = claim
+        self.stage = "Queued"
+        self.progress = 0.0
+        self.result: Optional[Dict[str, Any]] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        return self.result is not None
+
+    def update(self, stage: str, progress: float) -> None:
+        """Progress callback passed to FactChecker.fact_check."""
+        self.stage = stage
+        self.progress = progress
+
+
+class JobManager:
+    """
+    Runs fact-checks on a shared worker pool and caches results per claim.
+
+    Submitting a claim that is already running attaches to the existing job,
+    and a successful result is reused until `result_ttl` expires.
+    """
+
+    def __init__(self, checker, max_workers: int = 4, result_ttl: float = 3600):
+        """
+        Args:
+            checker: Shared FactChecker instance
+            max_workers: Number of pipelines run concurrently
+            result_ttl: Seconds a successful result is reused for the same claim
+        """
+        self.checker = checker
+        self.result_ttl = result_ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fact-check")
+        self._jobs: Dict[str, FactCheckJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, claim: str) -> FactCheckJob:
+        """Return the running or cached job for a claim, starting one if needed."""
+        key = clean_text(claim).lower()
+        with self._lock:
+            self._evict_expired()
+            job = self._jobs.get(key)
+            if job and (not job.done or job.result.get("status") == "success"):
+                return job
+            job = FactCheckJob(claim)
+            self._jobs[key] = job
+        self._executor.submit(self._run, job)
+        return job
+
+    def _run(self, job: FactCheckJob) -> None:
+        try:
+            result = self.checker.fact_check(job.claim, progress_callback=job.update)
+        except Exception as e:
+            result = {"error": str(e), "status": "error"}
+        job.finished_at = time.time()
+        job.result = result
+
+    def _evict_expired(self) -> None:
+        now = time.time()
+        expired = [
+            key for key, job in self._jobs.items()
+            if job.done and now - job.finished_at > self.result_ttl
+        ]
+        for key in expired:
+            del self._jobs[key]
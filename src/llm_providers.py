@@ -0,0 +1,246 @@
+import asyncio
+import hashlib
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+from .evidence_packer import estimate_tokens
+
+
+class LLMError(Exception):
+    """Provider failure; `status_code` carries the HTTP status when there is one."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@dataclass
+class LLMResponse:
+    """Completion text plus the usage figures the model router records."""
+    text: str
+    model: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency: float = 0.0
+
+
+class LLMProvider(ABC):
+    """
+    Interface every pipeline stage talks to.
+
+    Subclasses implement `_complete` (and optionally `_stream`); the public
+    methods add timing and per-model usage accounting on top.
+    """
+
+    # Identifies the backend, e.g. to namespace cached verdicts
+    name = "llm"
+
+    def __init__(self):
+        self._usage: Dict[str, Dict[str, Any]] = {}
+        self._usage_lock = threading.Lock()
+
+    @abstractmethod
+    def _complete(self, prompt: str, model: str, temperature: float) -> LLMResponse:
+        """Run one completion against the backend."""
+
+    def _stream(self, prompt: str, model: str, temperature: float) -> Iterator[str]:
+        """Yield completion text in chunks; defaults to a single chunk."""
+        yield self._complete(prompt, model, temperature).text
+
+    def complete(self, prompt: str, model: str, temperature: float = 0.3) -> LLMResponse:
+        """Run a single completion and record its usage."""
+        start = time.perf_counter()
+        response = self._complete(prompt, model, temperature)
+        response.latency = time.perf_counter() - start
+        self._record(response)
+        return response
+
+    async def acomplete(self, prompt: str, model: str, temperature: float = 0.3) -> LLMResponse:
+        """Async variant of `complete`; runs the blocking call in a worker thread."""
+        return await asyncio.to_thread(self.complete, prompt, model, temperature)
+
+    def batch(
+        self,
+        prompts: List[str],
+        model: str,
+        temperature: float = 0.3,
+        max_workers: int = 4
+    ) -> List[LLMResponse]:
+        """Run several completions concurrently, returning responses in prompt order."""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda p: self.complete(p, model, temperature), prompts))
+
+    def stream(self, prompt: str, model: str, temperature: float = 0.3) -> Iterator[str]:
+        """Yield completion text as it arrives; usage is recorded once the stream ends."""
+        start = time.perf_counter()
+        chunks = []
+        for chunk in self._stream(prompt, model, temperature):
+            chunks.append(chunk)
+            yield chunk
+        text = "".join(chunks)
+        self._record(LLMResponse(
+            text=text,
+            model=model,
+            prompt_tokens=estimate_tokens(prompt),
+            completion_tokens=estimate_tokens(text),
+            latency=time.perf_counter() - start
+        ))
+
+    def usage(self) -> Dict[str, Dict[str, Any]]:
+        """Calls, tokens and total latency per model since construction."""
+        with self._usage_lock:
+            return {model: dict(entry) for model, entry in self._usage.items()}
+
+    def _record(self, response: LLMResponse) -> None:
+        with self._usage_lock:
+            entry = self._usage.setdefault(response.model, {
+                "calls": 0, "prompt_tokens": 0, "completion_tokens": 0, "latency": 0.0
+            })
+            entry["calls"] += 1
+            entry["prompt_tokens"] += response.prompt_tokens
+            entry["completion_tokens"] += response.completion_tokens
+            entry["latency"] += response.latency
+
+
+class GroqProvider(LLMProvider):
+    """Groq chat completions API."""
+
+    name = "groq"
+
+    def __init__(self, api_key: Optional[str] = None):
+        """
+        Args:
+            api_key: Groq API key; the Groq SDK falls back to GROQ_API_KEY
+        """
+        super().__init__()
+        from groq import Groq
+        self.client = Groq(api_key=api_key)
+
+    def _complete(self, prompt: str, model: str, temperature: float) -> LLMResponse:
+        try:
+            response = self.client.chat.completions.create(
+                messages=[{"role": "user", "content": prompt}],
+                model=model,
+                temperature=temperature
+            )
+        except Exception as e:
+            raise LLMError(str(e), status_code=getattr(e, "status_code", None)) from e
+        usage = response.usage
+        return LLMResponse(
+            text=response.choices[0].message.content,
+            model=model,
+            prompt_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+            completion_tokens=getattr(usage, "completion_tokens", 0) or 0
+        )
+
+    def _stream(self, prompt: str, model: str, temperature: float) -> Iterator[str]:
+        # Errors can surface mid-stream too, so the loop shares the try block
+        try:
+            stream = self.client.chat.completions.create(
+                messages=[{"role": "user", "content": prompt}],
+                model=model,
+                temperature=temperature,
+                stream=True
+            )
+            for chunk in stream:
+                content = chunk.choices[0].delta.content
+                if content:
+                    yield content
+        except Exception as e:
+            raise LLMError(str(e), status_code=getattr(e, "status_code", None)) from e
+
+
+class LocalProvider(LLMProvider):
+    """
+    Offline, deterministic stand-in for load tests and capacity planning.
+
+    Responses are derived from a hash of (model, prompt) and shaped like the
+    real stage outputs, so the full pipeline runs end to end without network.
+    """
+
+    name = "local"
+    VERDICTS = ("True", "False", "Uncertain")
+    CATEGORIES = ("Factual", "Opinion", "Mixed", "Unverifiable")
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seconds_per_token: float = 0.0,
+        unavailable_models: Optional[List[str]] = None
+    ):
+        """
+        Args:
+            latency: Fixed seconds added to every call
+            jitter: Extra seconds, scaled by a deterministic per-prompt fraction
+            seconds_per_token: Seconds per completion token, to mimic generation time
+            unavailable_models: Models that fail with a 404, to exercise fallback
+        """
+        super().__init__()
+        self.latency = latency
+        self.jitter = jitter
+        self.seconds_per_token = seconds_per_token
+        self.unavailable_models = set(unavailable_models or [])
+
+    def _complete(self, prompt: str, model: str, temperature: float) -> LLMResponse:
+        if model in self.unavailable_models:
+            raise LLMError(f"The model `{model}` does not exist", status_code=404)
+        digest = hashlib.sha256(f"{model}\n{prompt}".encode()).digest()
+        text = self._respond(prompt, digest)
+        completion_tokens = estimate_tokens(text)
+        delay = self.latency + self.jitter * digest[0] / 255 + self.seconds_per_token * completion_tokens
+        if delay > 0:
+            time.sleep(delay)
+        return LLMResponse(
+            text=text,
+            model=model,
+            prompt_tokens=estimate_tokens(prompt),
+            completion_tokens=completion_tokens
+        )
+
+    def _stream(self, prompt: str, model: str, temperature: float) -> Iterator[str]:
+        text = self._complete(prompt, model, temperature).text
+        for word in re.findall(r"\S+\s*", text):
+            yield word
+
+    def _respond(self, prompt: str, digest: bytes) -> str:
+        """Produce text shaped like the stage the prompt belongs to."""
+        if "Verifiable Claims:" in prompt:
+            text = prompt.split("Text:", 1)[-1].split("Verifiable Claims:", 1)[0]
+            sentences = [s.strip() for s in re.split(r"(?<=[.!?])\s+", text) if len(s.split()) >= 3]
+            sentences = sentences[:3] or ["The claim describes a verifiable fact."]
+            return "Verifiable Claims:\n" + "\n".join(f"{i}. {s}" for i, s in enumerate(sentences, 1))
+        if "Verdict: [True/False/Uncertain]" in prompt:
+            verdict = self.VERDICTS[digest[1] % len(self.VERDICTS)]
+            return f"Verdict: {verdict}\nReasoning: The cited evidence [1] is consistent with this verdict."
+        if "Final Report:" in prompt:
+            verdict = self.VERDICTS[digest[1] % 2]
+            confidence = ("Low", "Medium", "High")[digest[2] % 3]
+            return (f"Final verdict: {verdict}\n{confidence} confidence.\n"
+                    "Summary: Findings are based on the verified assumptions.")
+        if "Categories:" in prompt:
+            return self.CATEGORIES[digest[1] % len(self.CATEGORIES)]
+        claim = prompt.split("Claim:", 1)[-1].split("[/INST]", 1)[0].strip()
+        return f"{claim} This statement is commonly reported. Further sources discuss it in detail."
+
+
+def create_provider(name: str, **kwargs) -> LLMProvider:
+    """
+    Build a provider by name.
+
+    Args:
+        name: "groq" or "local"
+        **kwargs: Passed to the provider constructor
+
+    Returns:
+        LLMProvider: Configured provider
+    """
+    providers = {"groq": GroqProvider, "local": LocalProvider}
+    if name not in providers:
+        raise ValueError(f"Unknown LLM provider '{name}'. Choose from: {', '.join(providers)}")
+    return providers[name](**kwargs)
@@ -0,0 +1,114 @@
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .utils import log_error
+
+# HTTP statuses that mean "this model is not usable", not "this request is bad"
+FALLBACK_STATUS_CODES = (400, 404)
+
+
+class ModelRouter:
+    """Routes each pipeline stage to a model and tracks cost/latency per route."""
+
+    def __init__(
+        self,
+        stage_models: Dict[str, str],
+        default_model: str,
+        fallback_models: Optional[Dict[str, str]] = None,
+        model_costs: Optional[Dict[str, Tuple[float, float]]] = None
+    ):
+        """
+        Args:
+            stage_models: Mapping of stage name to model id
+            default_model: Model used for stages without a route
+            fallback_models: Mapping of model id to the alternate tried on 400/404
+            model_costs: Mapping of model id to (input, output) USD per million tokens
+        """
+        self.stage_models = dict(stage_models)
+        self.default_model = default_model
+        self.fallback_models = dict(fallback_models or {})
+        self.model_costs = dict(model_costs or {})
+        self.stats: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def candidates(self, stage: str) -> List[str]:
+        """Return the model for a stage followed by its fallback chain."""
+        models = []
+        model = self.stage_models.get(stage, self.default_model)
+        while model and model not in models:
+            models.append(model)
+            model = self.fallback_models.get(model)
+        return models
+
+    def run(self, stage: str, call: Callable[[str], Tuple[str, Any]]) -> str:
+        """
+        Run `call(model)` for a stage, falling back on 400/404 responses.
+
+        Args:
+            stage: Pipeline stage name
+            call: Function taking a model id and returning (text, usage)
+
+        Returns:
+            str: Text returned by the first model that succeeded
+        """
+        candidates = self.candidates(stage)
+        if not candidates:
+            raise ValueError(f"No model configured for stage '{stage}'")
+
+        last_error = None
+        for model in candidates:
+            start = time.perf_counter()
+            try:
+                text, usage = call(model)
+            except Exception as e:
+                self._record(stage, model, time.perf_counter() - start, None, failed=True)
+                if getattr(e, "status_code", None) not in FALLBACK_STATUS_CODES:
+                    raise
+                log_error(f"Model '{model}' rejected for stage '{stage}', trying fallback: {str(e)}")
+                last_error = e
+                continue
+            self._record(stage, model, time.perf_counter() - start, usage)
+            return text
+        raise last_error
+
+    def _record(self, stage: str, model: str, latency: float, usage: Any, failed: bool = False) -> None:
+        with self._lock:
+            entry = self.stats.setdefault((stage, model), {
+                "calls": 0, "failures": 0, "latency": 0.0,
+                "prompt_tokens": 0, "completion_tokens": 0
+            })
+            entry["calls"] += 1
+            entry["latency"] += latency
+            if failed:
+                entry["failures"] += 1
+            if usage is not None:
+                entry["prompt_tokens"] += getattr(usage, "prompt_tokens", 0) or 0
+                entry["completion_tokens"] += getattr(usage, "completion_tokens", 0) or 0
+
+    def report(self) -> List[Dict[str, Any]]:
+        """
+        Summarize calls, latency, tokens and estimated cost per (stage, model) route.
+
+        Returns:
+            list: One dict per route that has been used
+        """
+        with self._lock:
+            stats = {route: dict(entry) for route, entry in self.stats.items()}
+
+        rows = []
+        for (stage, model), entry in sorted(stats.items()):
+            input_cost, output_cost = self.model_costs.get(model, (0.0, 0.0))
+            cost = (entry["prompt_tokens"] * input_cost
+                    + entry["completion_tokens"] * output_cost) / 1_000_000
+            rows.append({
+                "stage": stage,
+                "model": model,
+                "calls": entry["calls"],
+                "failures": entry["failures"],
+                "avg_latency_s": round(entry["latency"] / entry["calls"], 3),
+                "prompt_tokens": entry["prompt_tokens"],
+                "completion_tokens": entry["completion_tokens"],
+                "cost_usd": round(cost, 6)
+            })
+        return rows
@@ -26,10 +26,11 @@ Based on the provided evidence, determine if this assumption is:
 - False (contradicted by evidence)
 - Uncertain (insufficient evidence)
 
-Provide your verdict and reasoning.
+Provide your verdict and reasoning, citing evidence by its [number].
 
 Assumption: {assumption}
-Evidence: {evidence}
+Evidence:
+{evidence}
 
 Structure your response as:
 Verdict: [True/False/Uncertain]
@@ -1,4 +1,6 @@
 import logging
+import os
+import tempfile
 from typing import Union, List, Dict, Any
 from pathlib import Path
 import json
@@ -31,12 +33,19 @@ def save_to_cache(data: Dict[str, Any], cache_file: str = "cache.json") -> bool:
     Returns:
         bool: True if successful
     """
+    tmp_file = None
     try:
-        with open(cache_file, 'w') as f:
+        # Write to a unique temp file and swap it in so readers never see a partial file
+        cache_dir = os.path.dirname(os.path.abspath(cache_file))
+        with tempfile.NamedTemporaryFile('w', dir=cache_dir, suffix='.tmp', delete=False) as f:
+            tmp_file = f.name
             json.dump(data, f)
+        os.replace(tmp_file, cache_file)
         return True
     except Exception as e:
         log_error(f"Cache save failed: {str(e)}")
+        if tmp_file and os.path.exists(tmp_file):
+            os.remove(tmp_file)
         return False
 
 def load_from_cache(cache_file: str = "cache.json") -> Union[Dict[str, Any], None]:
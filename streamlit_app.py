@@ -1,5 +1,6 @@
 import os
 import sys
+import time
 from pathlib import Path
 import streamlit as st
 from dotenv import load_dotenv
@@ -7,6 +8,8 @@ from dotenv import load_dotenv
 # Import FactChecker
 sys.path.append(str(Path(__file__).parent / "src"))
 from src.fact_checker import FactChecker
+from src.jobs import JobManager
+from config.settings import Settings
 
 # Load API key
 load_dotenv()
@@ -97,6 +100,80 @@ div[data-testid="stWarning"] {
 </style>
 """, unsafe_allow_html=True)
 
+# -------------------- Shared Checker --------------------
+@st.cache_resource
+def get_checker():
+    """One FactChecker (client, router, assumption cache) per server process."""
+    return FactChecker(groq_api_key=groq_key)
+
+@st.cache_resource
+def get_job_manager():
+    """Background worker pool and per-claim result cache shared by all sessions."""
+    return JobManager(
+        get_checker(),
+        max_workers=Settings.STREAMLIT_WORKERS,
+        result_ttl=Settings.RESULT_CACHE_TTL
+    )
+
+# -------------------- Result Rendering --------------------
+def render_result(result):
+    verdict = result.get("final_answer", {}).get("verdict", "").lower()
+    summary_text = (
+        result.get("final_answer", {}).get("summary_short")
+        or result.get("final_answer", {}).get("summary")
+        or ""
+    )
+
+    if "not visible" in summary_text.lower() or "false" in summary_text.lower():
+        verdict = "false"
+
+    st.markdown("---")
+
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.subheader("📝 Claim to Verify")
+    st.info(result.get("claim", "No claim provided."))
+    st.write(f"**Category:** {result.get('claim_type', 'Unknown')}")
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.subheader("📊 Final Verdict")
+    if verdict == "true":
+        st.success("✅ True")
+    elif verdict == "false":
+        st.error("❌ False")
+    else:
+        st.warning("⚠️ Uncertain")
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.subheader("📝 Summary")
+    st.write(summary_text or "No summary available.")
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.subheader("🔗 Key Evidence")
+    key_evidence = result.get("final_answer", {}).get("key_evidence", [])
+    if key_evidence:
+        for item in key_evidence:
+            st.markdown(f"🔹 [{item.get('title','No title')}]({item.get('url','#')})")
+    else:
+        st.write("No key evidence available.")
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.subheader("📌 Assumptions & Verification")
+    verification_results = result.get("verification_results", {})
+    if verification_results:
+        for assumption, data in verification_results.items():
+            verdict_text = data.get('verdict', 'Unknown')
+            st.write(f"**{assumption}** — {verdict_text}")
+    else:
+        st.write("No assumptions verified.")
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    with st.expander("📂 Show Detailed Analysis"):
+        st.json(result)
+
 # -------------------- Main App --------------------
 def main():
     st.title("AI Fact Checker Bot")
@@ -109,73 +186,27 @@ def main():
     )
 
     if st.button("Verify") and claim:
-        with st.spinner("Analyzing claim..."):
-            try:
-                checker = FactChecker(groq_api_key=groq_key)
-                result = checker.fact_check(claim)
-
-                verdict = result.get("final_answer", {}).get("verdict", "").lower()
-                summary_text = (
-                    result.get("final_answer", {}).get("summary_short")
-                    or result.get("final_answer", {}).get("summary")
-                    or ""
-                )
-
-                if "not visible" in summary_text.lower() or "false" in summary_text.lower():
-                    verdict = "false"
-
-                st.markdown("---")
-
-                st.markdown("<div class='card'>", unsafe_allow_html=True)
-                st.subheader("📝 Claim to Verify")
-                st.info(result.get("claim", "No claim provided."))
-                st.write(f"**Category:** {result.get('claim_type', 'Unknown')}")
-                st.markdown("</div>", unsafe_allow_html=True)
-
-                st.markdown("<div class='card'>", unsafe_allow_html=True)
-                st.subheader("📊 Final Verdict")
-                if verdict == "true":
-                    st.success("✅ True")
-                elif verdict == "false":
-                    st.error("❌ False")
-                else:
-                    st.warning("⚠️ Uncertain")
-                st.markdown("</div>", unsafe_allow_html=True)
-
-                st.markdown("<div class='card'>", unsafe_allow_html=True)
-                st.subheader("📝 Summary")
-                st.write(summary_text or "No summary available.")
-                st.markdown("</div>", unsafe_allow_html=True)
-
-                st.markdown("<div class='card'>", unsafe_allow_html=True)
-                st.subheader("🔗 Key Evidence")
-                key_evidence = result.get("final_answer", {}).get("key_evidence", [])
-                if key_evidence:
-                    for item in key_evidence:
-                        st.markdown(f"🔹 [{item.get('title','No title')}]({item.get('url','#')})")
-                else:
-                    st.write("No key evidence available.")
-                st.markdown("</div>", unsafe_allow_html=True)
-
-                st.markdown("<div class='card'>", unsafe_allow_html=True)
-                st.subheader("📌 Assumptions & Verification")
-                verification_results = result.get("verification_results", {})
-                if verification_results:
-                    for assumption, data in verification_results.items():
-                        verdict_text = data.get('verdict', 'Unknown')
-                        st.write(f"**{assumption}** — {verdict_text}")
-                else:
-                    st.write("No assumptions verified.")
-                st.markdown("</div>", unsafe_allow_html=True)
-
-                with st.expander("📂 Show Detailed Analysis"):
-                    st.json(result)
-
-            except Exception as e:
-                st.error(f"Error: {str(e)}")
+        st.session_state["job"] = get_job_manager().submit(claim)
+
+    # The job runs on the shared worker pool, so widget changes and reruns
+    # re-attach to it instead of restarting the pipeline.
+    job = st.session_state.get("job")
+    if job is None:
+        return
+
+    if not job.done:
+        st.progress(job.progress, text=f"Analyzing claim... {job.stage}")
+        time.sleep(Settings.PROGRESS_POLL_INTERVAL)
+        st.rerun()
+
+    result = job.result
+    if result.get("status") == "error":
+        st.error(f"Error: {result.get('error', 'Unknown error')}")
+    else:
+        render_result(result)
 
 if __name__ == "__main__":
-    if not groq_key:
+    if not groq_key and Settings.LLM_PROVIDER == "groq":
         st.error("❌ Missing GROQ_API_KEY in .env file.")
     else:
         main()
@@ -0,0 +1,136 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.utils import load_from_cache
+from src.assumption_store import (
+    AssumptionStore, canonical_key, normalize_assumption, unique_assumptions
+)
+
+class TestAssumptionNormalization(unittest.TestCase):
+    def test_strips_bullets_and_numbering(self):
+        self.assertEqual(normalize_assumption("1. The Sun is a star."), "The Sun is a star.")
+        self.assertEqual(normalize_assumption("- **The Sun is a star.**"), "The Sun is a star.")
+        self.assertEqual(normalize_assumption("  * 2) Water boils at 100 °C"), "Water boils at 100 °C")
+
+    def test_keeps_initials_and_leading_numbers(self):
+        self.assertEqual(normalize_assumption("E. coli is a bacterium."), "E. coli is a bacterium.")
+        self.assertEqual(
+            normalize_assumption("J. K. Rowling wrote Harry Potter."),
+            "J. K. Rowling wrote Harry Potter."
+        )
+        self.assertEqual(normalize_assumption("2. 1969. Apollo 11 landed"), "1969. Apollo 11 landed")
+        self.assertEqual(normalize_assumption("a) Water is wet."), "Water is wet.")
+
+    def test_drops_headers_and_markup(self):
+        for line in ["Verifiable Claims:", "**Verifiable Claims:**", "**Verifiable Claims**",
+                     "Verifiable Claims", "- Factual claims", "### Claims", "---", "", "-"]:
+            self.assertIsNone(normalize_assumption(line), line)
+
+    def test_canonical_key_ignores_formatting(self):
+        self.assertEqual(
+            canonical_key("The Moon's distance from Earth is approximately 384,000 km."),
+            canonical_key("the moon s distance from earth is approximately 384000 km")
+        )
+        self.assertNotEqual(canonical_key("Pi is 3.14"), canonical_key("Pi is 314"))
+
+    def test_non_ascii_assumptions_keep_distinct_keys(self):
+        self.assertEqual(canonical_key("Земля круглая."), "земля круглая")
+        self.assertNotEqual(canonical_key("Земля круглая."), canonical_key("Луна сделана из сыра."))
+        self.assertEqual(canonical_key("La Tour Eiffel mesure 330 mètres."), "la tour eiffel mesure 330 mètres")
+        self.assertEqual(canonical_key("Água ferve a 100 graus."), "água ferve a 100 graus")
+        self.assertEqual(
+            unique_assumptions(["1. Земля круглая.", "2. Луна сделана из сыра.", "3. земля круглая"]),
+            ["Земля круглая.", "Луна сделана из сыра."]
+        )
+
+    def test_unique_assumptions_dedupes_in_order(self):
+        lines = ["Verifiable Claims:", "1. The Sun is a star.", "- the sun is a star", "2. Earth orbits the Sun."]
+        self.assertEqual(unique_assumptions(lines), ["The Sun is a star.", "Earth orbits the Sun."])
+
+class TestAssumptionStore(unittest.TestCase):
+    def test_reuses_fresh_verdicts(self):
+        store = AssumptionStore(ttl_seconds=60)
+        store.put("The Sun is a star.", {"verdict": "True"})
+        self.assertEqual(store.get("the sun is a star")["verdict"], "True")
+        self.assertEqual(store.stats()["hits"], 1)
+
+    def test_non_ascii_verdicts_are_not_shared(self):
+        store = AssumptionStore(ttl_seconds=60)
+        store.put("Земля круглая.", {"verdict": "True"})
+        self.assertIsNone(store.get("Луна сделана из сыра."))
+        self.assertEqual(store.get("земля круглая")["verdict"], "True")
+
+    def test_letterless_keys_are_not_cached_or_deduped(self):
+        store = AssumptionStore(ttl_seconds=60)
+        store.put("1969 — 384,400", {"verdict": "True"})
+        self.assertEqual(store.stats()["entries"], 0)
+        self.assertIsNone(store.get("1969 — 384,400"))
+        self.assertEqual(unique_assumptions(["- 42 %", "- 42 %"]), ["42 %", "42 %"])
+
+    def test_namespaces_are_isolated(self):
+        store = AssumptionStore(ttl_seconds=60)
+        store.put("The Sun is a star.", {"verdict": "False"}, namespace="local")
+        self.assertIsNone(store.get("The Sun is a star.", namespace="groq"))
+        self.assertEqual(store.get("The Sun is a star.", namespace="local")["verdict"], "False")
+
+    def test_expired_and_error_entries_are_not_reused(self):
+        store = AssumptionStore(ttl_seconds=60)
+        store.put("Claim that failed", {"verdict": "Error"})
+        self.assertIsNone(store.get("Claim that failed"))
+        with patch("src.assumption_store.time.time", return_value=1000.0):
+            store.put("The Sun is a star.", {"verdict": "True"})
+        with patch("src.assumption_store.time.time", return_value=1061.0):
+            self.assertIsNone(store.get("The Sun is a star."))
+
+    def test_put_prunes_expired_entries_without_cache_file(self):
+        store = AssumptionStore(ttl_seconds=60)
+        with patch("src.assumption_store.time.time", return_value=1000.0):
+            store.put("The Sun is a star.", {"verdict": "True"})
+        with patch("src.assumption_store.time.time", return_value=1061.0):
+            store.put("Earth orbits the Sun.", {"verdict": "True"})
+        self.assertEqual(store.stats()["entries"], 1)
+
+    def test_oldest_entries_evicted_beyond_cap(self):
+        store = AssumptionStore(ttl_seconds=600, max_entries=2)
+        for i, claim in enumerate(["The Sun is a star.", "Earth orbits the Sun.", "Water is wet."]):
+            with patch("src.assumption_store.time.time", return_value=1000.0 + i):
+                store.put(claim, {"verdict": "True"})
+        with patch("src.assumption_store.time.time", return_value=1010.0):
+            self.assertIsNone(store.get("The Sun is a star."))
+            self.assertIsNotNone(store.get("Water is wet."))
+        self.assertEqual(store.stats()["entries"], 2)
+
+    def test_persists_to_cache_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "assumptions.json")
+            AssumptionStore(cache_file=path).put("The Sun is a star.", {"verdict": "True"})
+            self.assertEqual(AssumptionStore(cache_file=path).get("The Sun is a star.")["verdict"], "True")
+
+    def test_stores_sharing_a_file_merge_entries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "assumptions.json")
+            first, second = AssumptionStore(cache_file=path), AssumptionStore(cache_file=path)
+            first.put("The Sun is a star.", {"verdict": "True"})
+            second.put("Earth orbits the Sun.", {"verdict": "True"})
+            self.assertEqual(len(load_from_cache(path)), 2)
+            self.assertEqual(first.get("Earth orbits the Sun.")["verdict"], "True")
+
+    def test_expired_entries_are_pruned_from_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "assumptions.json")
+            store = AssumptionStore(ttl_seconds=60, cache_file=path)
+            with patch("src.assumption_store.time.time", return_value=1000.0):
+                store.put("The Sun is a star.", {"verdict": "True"})
+            store.put("Earth orbits the Sun.", {"verdict": "True"})
+            self.assertEqual(list(load_from_cache(path)), ["earth orbits the sun"])
+
+    def test_unusable_cache_file_falls_back_to_memory(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "missing", "assumptions.json")
+            store = AssumptionStore(cache_file=path)
+            store.put("The Sun is a star.", {"verdict": "True"})
+            self.assertEqual(store.get("The Sun is a star.")["verdict"], "True")
+
+if __name__ == '__main__':
+    unittest.main()
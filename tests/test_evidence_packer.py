@@ -0,0 +1,58 @@
+import unittest
+from src.evidence_packer import EvidencePacker, estimate_tokens
+
+def source(url, snippet, domain="example.com", title=""):
+    return {"title": title, "url": url, "snippet": snippet, "domain": domain}
+
+class TestEvidencePacker(unittest.TestCase):
+    def setUp(self):
+        self.packer = EvidencePacker(token_budget=60, max_snippet_chars=120)
+
+    def test_dedupes_repeated_and_contained_snippets(self):
+        sources = [
+            source("https://a.com/1", "The Moon is 384,400 km from Earth."),
+            source("https://b.org/2", "the moon is 384,400 km from earth"),
+            source("https://c.gov/3", "On average the Moon is 384,400 km from Earth."),
+            source("https://a.com/1", "Same URL, different snippet."),
+        ]
+        packed = self.packer.pack("Moon distance from Earth", sources)
+        self.assertEqual([s["url"] for s in packed["sources"]], ["https://c.gov/3"])
+        self.assertEqual(packed["dropped"], 3)
+
+    def test_ranks_by_relevance_and_renders_citations(self):
+        sources = [
+            source("https://x.com", "Bananas are rich in potassium."),
+            source("https://y.edu", "The Moon orbits Earth at about 384,400 km.", "y.edu"),
+        ]
+        packed = self.packer.pack("Moon distance from Earth", sources)
+        self.assertTrue(packed["text"].startswith("[1] The Moon orbits Earth"))
+        self.assertIn("(y.edu)", packed["text"])
+
+    def test_respects_token_budget(self):
+        sources = [source(f"https://s{i}.com", f"Distinct fact number {i} " * 6) for i in range(10)]
+        packed = self.packer.pack("fact", sources)
+        self.assertLessEqual(packed["tokens"], 60)
+        self.assertGreater(packed["dropped"], 0)
+
+    def test_truncates_single_source_over_budget(self):
+        packer = EvidencePacker(token_budget=20, max_snippet_chars=1000)
+        packed = packer.pack("fact", [source("https://s.com", "word " * 100)])
+        self.assertEqual(len(packed["sources"]), 1)
+        self.assertLessEqual(packed["tokens"], 20)
+
+    def test_keeps_non_ascii_snippets(self):
+        sources = [
+            source("https://a.ru/1", "Луна находится в 384 400 км от Земли."),
+            source("https://b.ru/2", "Земля вращается вокруг Солнца."),
+        ]
+        packed = self.packer.pack("Луна", sources)
+        self.assertEqual(len(packed["sources"]), 2)
+        self.assertTrue(packed["text"].startswith("[1] Луна"))
+
+    def test_empty_evidence(self):
+        packed = self.packer.pack("anything", [])
+        self.assertEqual(packed["text"], "No evidence found.")
+        self.assertEqual(estimate_tokens(""), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import patch, MagicMock
 from src.fact_checker import FactChecker
+from src.llm_providers import LocalProvider
 
 class TestFactChecker(unittest.TestCase):
     @patch('src.fact_checker.ChatOpenAI')
@@ -26,5 +27,63 @@ class TestFactChecker(unittest.TestCase):
             result = self.checker.fact_check("Test claim")
             self.assertEqual(result["claim_type"], "Factual")
 
+class StaticSearch:
+    def search(self, query):
+        return [{"title": "Source", "url": "https://nasa.gov/moon",
+                 "snippet": f"Evidence: {query}", "domain": "nasa.gov"}]
+
+class EmptySearch:
+    def search(self, query):
+        return []
+
+class TestFactCheckerOffline(unittest.TestCase):
+    def setUp(self):
+        self.provider = LocalProvider(unavailable_models=["openai/gpt-oss-120b"])
+        self.checker = FactChecker(provider=self.provider, search_tool=StaticSearch())
+
+    def test_pipeline_runs_on_local_provider(self):
+        stages = []
+        result = self.checker.fact_check(
+            "The Moon is about 384,400 km from Earth. It orbits every 27 days.",
+            progress_callback=lambda stage, fraction: stages.append(stage)
+        )
+        self.assertEqual(result["status"], "success")
+        self.assertIn(result["final_answer"]["verdict"], ("True", "False", "Uncertain"))
+        self.assertEqual(stages[-1], "Done")
+        self.assertTrue(any(row["failures"] for row in self.checker.routing_report()))
+
+    def test_verdicts_without_evidence_are_not_cached(self):
+        checker = FactChecker(provider=self.provider, search_tool=EmptySearch())
+        result = checker.fact_check("The Moon is about 384,400 km from Earth.")
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(checker.assumption_store.stats()["entries"], 0)
+
+    def test_local_verdicts_are_not_served_to_other_providers(self):
+        claim = "The Moon is about 384,400 km from Earth."
+        self.checker.fact_check(claim)
+        store = self.checker.assumption_store
+        self.assertIsNone(store.get("The Moon is about 384,400 km from Earth.", namespace="groq"))
+        self.assertIsNotNone(store.get("The Moon is about 384,400 km from Earth.", namespace="local"))
+
+    def test_synthesis_receives_compact_verification(self):
+        summary = self.checker._summarize_verification({
+            "The Sun is a star.": {
+                "verdict": "True",
+                "analysis": "Verdict: True\nReasoning: Source [1] says so.",
+                "evidence": [{"domain": "nasa.gov", "snippet": "long text"}],
+                "prompt_tokens": 120,
+                "cached": True
+            }
+        })
+        self.assertEqual(summary, "- The Sun is a star. => True: Source [1] says so. (sources: nasa.gov)")
+
+    def test_repeated_assumptions_are_served_from_cache(self):
+        claim = "The Moon is about 384,400 km from Earth. It orbits every 27 days."
+        self.checker.fact_check(claim)
+        result = self.checker.fact_check(claim)
+        self.assertTrue(all(v.get("cached") for v in result["verification_results"].values()))
+        self.assertTrue(all(v["prompt_tokens"] == 0 for v in result["verification_results"].values()))
+        self.assertTrue(all(v["original_prompt_tokens"] > 0 for v in result["verification_results"].values()))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,63 @@
+import threading
+import time
+import unittest
+from src.jobs import JobManager
+
+class FakeChecker:
+    def __init__(self, status="success"):
+        self.calls = 0
+        self.status = status
+        self.release = threading.Event()
+
+    def fact_check(self, claim, progress_callback=None):
+        self.calls += 1
+        progress_callback("Verifying assumptions", 0.3)
+        self.release.wait(5)
+        return {"claim": claim, "status": self.status}
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out waiting for background job")
+        time.sleep(0.01)
+
+def wait_done(job):
+    wait_until(lambda: job.done)
+
+class TestJobManager(unittest.TestCase):
+    def test_concurrent_submissions_share_one_run(self):
+        checker = FakeChecker()
+        manager = JobManager(checker, max_workers=2)
+        first = manager.submit("The Sun is a star")
+        second = manager.submit("  the sun is a STAR ")
+        self.assertIs(first, second)
+        checker.release.set()
+        wait_done(first)
+        self.assertEqual(first.result["status"], "success")
+        self.assertIs(manager.submit("The Sun is a star"), first)
+        self.assertEqual(checker.calls, 1)
+
+    def test_reports_progress_and_retries_errors(self):
+        checker = FakeChecker(status="error")
+        manager = JobManager(checker)
+        job = manager.submit("Claim")
+        wait_until(lambda: job.stage != "Queued")
+        self.assertEqual(job.stage, "Verifying assumptions")
+        checker.release.set()
+        wait_done(job)
+        retry = manager.submit("Claim")
+        self.assertIsNot(retry, job)
+        wait_done(retry)
+
+    def test_expired_results_are_rerun(self):
+        checker = FakeChecker()
+        checker.release.set()
+        manager = JobManager(checker, result_ttl=0)
+        job = manager.submit("Claim")
+        wait_done(job)
+        job.finished_at -= 1
+        self.assertIsNot(manager.submit("Claim"), job)
+
+if __name__ == '__main__':
+    unittest.main()
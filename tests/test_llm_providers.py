@@ -0,0 +1,77 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+from src.llm_providers import GroqProvider, LLMError, LocalProvider, create_provider
+from src.model_router import ModelRouter
+from src.prompt_chains import VERIFICATION_TEMPLATE
+
+class TestLocalProvider(unittest.TestCase):
+    def setUp(self):
+        self.provider = LocalProvider()
+
+    def test_responses_are_deterministic(self):
+        first = self.provider.complete("Claim: The Sun is a star.", model="m")
+        second = self.provider.complete("Claim: The Sun is a star.", model="m")
+        self.assertEqual(first.text, second.text)
+        self.assertGreater(first.prompt_tokens, 0)
+
+    def test_verification_output_has_verdict(self):
+        prompt = VERIFICATION_TEMPLATE.format(assumption="The Sun is a star.", evidence="[1] ...")
+        text = self.provider.complete(prompt, model="m").text
+        self.assertRegex(text, r"^Verdict: (True|False|Uncertain)\n")
+
+    def test_batch_async_and_stream(self):
+        prompts = [f"Claim: fact {i}" for i in range(5)]
+        batch = self.provider.batch(prompts, model="m")
+        self.assertEqual([r.text for r in batch], [self.provider.complete(p, "m").text for p in prompts])
+        async_text = asyncio.run(self.provider.acomplete(prompts[0], model="m")).text
+        self.assertEqual(async_text, batch[0].text)
+        self.assertEqual("".join(self.provider.stream(prompts[0], model="m")), batch[0].text)
+        self.assertEqual(self.provider.usage()["m"]["calls"], 12)
+
+    def test_configurable_latency(self):
+        provider = LocalProvider(latency=0.05)
+        provider.batch(["a b c"] * 4, model="m", max_workers=4)
+        self.assertGreaterEqual(provider.usage()["m"]["latency"], 0.2)
+
+    def test_unavailable_model_triggers_router_fallback(self):
+        provider = LocalProvider(unavailable_models=["big"])
+        with self.assertRaises(LLMError) as ctx:
+            provider.complete("hi there", model="big")
+        self.assertEqual(ctx.exception.status_code, 404)
+
+        router = ModelRouter({"verify": "big"}, default_model="small", fallback_models={"big": "small"})
+        def call(model):
+            response = provider.complete("hi there", model=model)
+            return response.text, response
+        router.run("verify", call)
+        self.assertEqual([row["model"] for row in router.report() if not row["failures"]], ["small"])
+
+    def test_create_provider(self):
+        self.assertIsInstance(create_provider("local", latency=0.1), LocalProvider)
+        with self.assertRaises(ValueError):
+            create_provider("nope")
+
+class StatusError(Exception):
+    status_code = 503
+
+class BrokenStreamClient:
+    """Groq-shaped client whose stream fails after the first chunk."""
+    def __init__(self):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="Hello"))])
+        raise StatusError("connection reset")
+
+class TestGroqProvider(unittest.TestCase):
+    def test_mid_stream_errors_are_wrapped(self):
+        with patch("groq.Groq", return_value=BrokenStreamClient()):
+            provider = GroqProvider(api_key="test_key")
+        with self.assertRaises(LLMError) as ctx:
+            list(provider.stream("hi there", model="m"))
+        self.assertEqual(ctx.exception.status_code, 503)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from types import SimpleNamespace
+from src.model_router import ModelRouter
+
+class StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+class TestModelRouter(unittest.TestCase):
+    def setUp(self):
+        self.router = ModelRouter(
+            stage_models={"classify": "small", "verify": "large"},
+            default_model="medium",
+            fallback_models={"large": "medium", "medium": "small"},
+            model_costs={"large": (1.0, 2.0)}
+        )
+
+    def test_candidates_follow_fallback_chain(self):
+        self.assertEqual(self.router.candidates("verify"), ["large", "medium", "small"])
+        self.assertEqual(self.router.candidates("unknown"), ["medium", "small"])
+
+    def test_falls_back_on_404(self):
+        def call(model):
+            if model == "large":
+                raise StatusError(404)
+            return model, SimpleNamespace(prompt_tokens=10, completion_tokens=5)
+
+        self.assertEqual(self.router.run("verify", call), "medium")
+        report = {row["model"]: row for row in self.router.report()}
+        self.assertEqual(report["large"]["failures"], 1)
+        self.assertEqual(report["medium"]["prompt_tokens"], 10)
+
+    def test_other_errors_are_raised(self):
+        def call(model):
+            raise StatusError(500)
+
+        with self.assertRaises(StatusError):
+            self.router.run("verify", call)
+
+    def test_missing_model_raises_value_error(self):
+        router = ModelRouter(stage_models={}, default_model="")
+        with self.assertRaisesRegex(ValueError, "No model configured for stage 'verify'"):
+            router.run("verify", lambda model: ("ok", None))
+
+    def test_cost_uses_model_prices(self):
+        usage = SimpleNamespace(prompt_tokens=1_000_000, completion_tokens=500_000)
+        self.router.run("verify", lambda model: ("ok", usage))
+        self.assertEqual(self.router.report()[0]["cost_usd"], 2.0)
+
+if __name__ == '__main__':
+    unittest.main()